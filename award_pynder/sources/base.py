@@ -1,11 +1,21 @@
 """Data sources module for the award_pynder package."""
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Literal
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Literal
+from urllib.parse import urlparse
 
 import pandas as pd
+import requests
+import requests_cache
 from dateutil.parser import parse as dateutil_parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .. import __version__
 
 ###############################################################################
 
@@ -30,6 +40,58 @@ ALL_DATASET_FIELDS = [
     for field_name, field_value in vars(DatasetFields).items()
     if not field_name.startswith("_")
 ]
+ALL_DATASET_FIELDS_SET = frozenset(ALL_DATASET_FIELDS)
+
+# (connect, read) timeouts in seconds for every API request
+DEFAULT_REQUEST_TIMEOUT = (5, 60)
+
+# How long responses stay in the on-disk cache when caching is requested
+DEFAULT_CACHE_EXPIRATION = timedelta(hours=24)
+
+###############################################################################
+
+
+class RateLimiter:
+    """Thread-safe limiter which spaces out calls by a minimum interval."""
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller is allowed to make its next call."""
+        # Reserve the next slot while holding the lock but sleep outside of it
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.min_interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Rate limiters for hosts which ask clients to pace their requests
+_HOST_RATE_LIMITERS: dict[str, RateLimiter] = {}
+
+
+class _RateLimitedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter which paces sends to hosts with a registered rate limiter."""
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        # Cached sessions answer cache hits before reaching the adapter,
+        # so only requests which actually go over the network wait
+        rate_limiter = _HOST_RATE_LIMITERS.get(urlparse(request.url or "").netloc)
+        if rate_limiter is not None:
+            rate_limiter.wait()
+
+        return super().send(request, *args, **kwargs)
+
 
 ###############################################################################
 
@@ -37,27 +99,119 @@ ALL_DATASET_FIELDS = [
 class DataSource(ABC):
     """Abstract base class for data sources."""
 
+    @staticmethod
+    def _create_session(
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        use_cache: bool = False,
+    ) -> requests.Session:
+        # Shared sessions reuse kept-alive connections across requests and
+        # handle throttling by backing off on 429 / Retry-After rather than
+        # sleeping between every request
+        # Accept-Encoding is left to requests, which advertises brotli
+        # alongside gzip / deflate whenever brotli is installed
+        session: requests.Session
+        if use_cache:
+            # Cache keys include the request body so POST searches are distinct
+            session = requests_cache.CachedSession(
+                cache_name="award_pynder_cache",
+                backend="sqlite",
+                use_cache_dir=True,
+                expire_after=DEFAULT_CACHE_EXPIRATION,
+                allowable_methods=("GET", "POST"),
+            )
+        else:
+            session = requests.Session()
+        session.headers.update({"User-Agent": f"award-pynder/{__version__}"})
+        session.mount(
+            "https://",
+            _RateLimitedHTTPAdapter(
+                # Sessions are typically dedicated to a single host
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    respect_retry_after_header=True,
+                    # Every source only reads data, so POSTs are safe to retry
+                    allowed_methods=frozenset({"GET", "POST"}),
+                ),
+            ),
+        )
+
+        return session
+
+    @staticmethod
+    def _register_rate_limiter(url: str, min_interval: float) -> RateLimiter:
+        # Every session created by _create_session paces network sends to the
+        # url's host, whether or not the session caches responses
+        rate_limiter = RateLimiter(min_interval=min_interval)
+        _HOST_RATE_LIMITERS[urlparse(url).netloc] = rate_limiter
+        return rate_limiter
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_cached_session() -> requests.Session:
+        # Created on first use so the cache file is only touched when requested,
+        # shared by all sources
+        return DataSource._create_session(
+            pool_connections=8,
+            pool_maxsize=16,
+            use_cache=True,
+        )
+
     @staticmethod
     def _parse_datetime(dt: str | datetime) -> datetime:
         if isinstance(dt, str):
-            return dateutil_parse(dt)
+            # Most strings are ISO-8601, which the C parser handles much faster
+            # than dateutil; only fall back to dateutil for anything else
+            try:
+                return datetime.fromisoformat(dt)
+            except ValueError:
+                return dateutil_parse(dt)
 
         return dt
 
     @staticmethod
-    def _format_date_for_pynder_standard(
-        dt: str | datetime,
+    def _format_dates_for_pynder_standard(
+        dates: pd.Series,
         fmt: Literal["year", "date"] = "date",
-    ) -> str | int | None:
-        if dt is None:
-            return None
-        if isinstance(dt, str):
-            dt = dateutil_parse(dt)
-
+        date_format: str | None = None,
+    ) -> pd.Series:
+        # Many rows share the same raw date (fiscal year boundaries, standard
+        # start dates), so parse and format each unique value only once
+        codes, uniques = pd.factorize(dates)
+        unique_dates: pd.Series = pd.Series(uniques)
+        if date_format == "ISO8601":
+            # Only the calendar date is kept, so values starting with a full
+            # date are cut down to it, this keeps the local date of timestamps
+            # with a UTC offset rather than shifting them to the date in UTC
+            # Anything else (year only, missing) is parsed as it is
+            unique_dates = unique_dates.astype("string")
+            has_full_date = unique_dates.str.match(r"\d{4}-\d{2}-\d{2}")
+            unique_dates = unique_dates.mask(
+                has_full_date.fillna(False),
+                unique_dates.str[:10],
+            )
+
+        parsed = pd.to_datetime(
+            unique_dates,
+            format=date_format,
+            errors="coerce",
+        )
+        formatted: pd.Series
         if fmt == "year":
-            return dt.year
-
-        return dt.date().isoformat()
+            formatted = parsed.dt.year.astype("Int64")
+        else:
+            formatted = parsed.dt.strftime("%Y-%m-%d")
+
+        # Map back to the original rows, missing values stay missing
+        return pd.Series(
+            formatted.array.take(codes, allow_fill=True),
+            index=dates.index,
+            name=dates.name,
+        )
 
     @staticmethod
     @abstractmethod
@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import logging
-import time
-from copy import deepcopy
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
-from .base import ALL_DATASET_FIELDS, DatasetFields, DataSource
+from .base import (
+    ALL_DATASET_FIELDS,
+    ALL_DATASET_FIELDS_SET,
+    DEFAULT_REQUEST_TIMEOUT,
+    DatasetFields,
+    DataSource,
+)
 
 ###############################################################################
 
@@ -20,6 +25,7 @@ log = logging.getLogger(__name__)
 ###############################################################################
 
 _DEFAULT_CHUNK_SIZE = 100
+_DEFAULT_MAX_WORKERS = 8
 
 # Mellon uses GraphQL for their API
 # To try and debug / for documentation, use: https://graphdoc.io/
@@ -48,48 +54,55 @@ fragment GrantSearchResults on GrantSearchResultWithTotal {
             dateAwarded
             id
             grantee
+            amount
         }
     }
     totalCount
 }
 """.strip()  # noqa: E501
-_DEFAULT_BULK_PARAMS: dict = {
-    "operationName": "GrantFilterQuery",
-    "variables": {
-        "limit": _DEFAULT_CHUNK_SIZE,
-        "offset": 0,
-        "term": "",
-        "sort": "MOST_RELEVANT",
-        "years": [],
-        "grantMakingAreas": [],
-        "ideas": [],
-        "pastProgram": False,
-        "amountRanges": [],
-        "country": [],
-        "state": [],
-        "features": [],
-    },
-    "query": _BULK_QUERY_STATEMENT,
-}
-
-# Single Query means we can get the details of a single grant
-# In this case, we only need the funding amount
-_SINGLE_GRANT_QUERY_STATEMENT = """
-query($grantId: String!) {
-    grantDetails(grantId: $grantId) {
-        grant {
-            amount
-        }
+# Count Query uses the same search but only resolves the total number of grants
+_COUNT_QUERY_STATEMENT = """
+query GrantCountQuery($term: String!, $limit: Int!, $offset: Int!, $sort: SearchSort, $amountRanges: [FilterRangeInput!], $grantMakingAreas: [String!], $country: [String!], $pastProgram: Boolean, $yearRange: FilterRangeInput, $years: [Int!], $state: [String!], $ideas: [String!], $features: [String!]) {
+    grantSearch(
+        term: $term
+        limit: $limit
+        offset: $offset
+        sort: $sort
+        filter: {pastProgram: $pastProgram, grantMakingAreas: $grantMakingAreas, country: $country, years: $years, yearRange: $yearRange, amountRanges: $amountRanges, state: $state, ideas: $ideas, features: $features}
+    ) {
+        totalCount
     }
 }
-""".strip()
-_DEFAULT_SINGLE_PARAMS: dict = {
-    "variables": {
-        "grantId": "",
-    },
-    "query": _SINGLE_GRANT_QUERY_STATEMENT,
+""".strip()  # noqa: E501
+
+# Fields selected for each grant in the bulk query, in selection order
+_GRANT_FIELDS = [
+    "title",
+    "grantMakingArea",
+    "description",
+    "dateAwarded",
+    "id",
+    "grantee",
+    "amount",
+]
+_DEFAULT_BULK_VARIABLES: dict = {
+    "limit": _DEFAULT_CHUNK_SIZE,
+    "offset": 0,
+    "term": "",
+    "sort": "MOST_RELEVANT",
+    "years": [],
+    "grantMakingAreas": [],
+    "ideas": [],
+    "pastProgram": False,
+    "amountRanges": [],
+    "country": [],
+    "state": [],
+    "features": [],
 }
 
+# Single host, one kept-alive connection per concurrent chunk worker
+_SESSION = DataSource._create_session(pool_maxsize=_DEFAULT_MAX_WORKERS)
+
 ###############################################################################
 
 
@@ -103,34 +116,36 @@ class Mellon(DataSource):
         to_datetime: str | datetime | None,
         offset: int,
         limit: int = _DEFAULT_CHUNK_SIZE,
+        count_only: bool = False,
     ) -> dict:
-        # Get years
+        # Get years, only parsing bounds that were given as strings
         years = []
-        if from_datetime is not None and to_datetime is None:
-            to_datetime = datetime.utcnow()
-        if from_datetime is not None and to_datetime is not None:
-            from_datetime_parsed = DataSource._parse_datetime(from_datetime)
-            to_datetime_parsed = DataSource._parse_datetime(to_datetime)
-
-            # Get all years between from and to
-            years = list(
-                range(
-                    from_datetime_parsed.year,
-                    to_datetime_parsed.year + 1,
-                )
+        if from_datetime is not None:
+            from_year = DataSource._parse_datetime(from_datetime).year
+            to_year = (
+                DataSource._parse_datetime(to_datetime).year
+                if to_datetime is not None
+                else datetime.now(timezone.utc).year  # noqa: UP017
             )
 
-        # Copy and update params
-        params = deepcopy(_DEFAULT_BULK_PARAMS)
-        params["variables"]["term"] = query or ""
-        params["variables"]["offset"] = offset
-        params["variables"]["years"] = years
-        params["variables"]["limit"] = limit
-
-        # Return the full API string
-        return params
+            # Get all years between from and to
+            years = list(range(from_year, to_year + 1))
+
+        # Build params, overriding only the variables that change per request
+        return {
+            "operationName": "GrantCountQuery" if count_only else "GrantFilterQuery",
+            "variables": {
+                **_DEFAULT_BULK_VARIABLES,
+                "term": query or "",
+                "offset": offset,
+                "years": years,
+                "limit": limit,
+            },
+            "query": _COUNT_QUERY_STATEMENT if count_only else _BULK_QUERY_STATEMENT,
+        }
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _query_total_grants(
         query: str | None = None,
         from_datetime: str | datetime | None = None,
@@ -144,18 +159,24 @@ class Mellon(DataSource):
                 to_datetime=to_datetime,
                 offset=0,
                 limit=1,
+                count_only=True,
             )
 
             # Request
-            resp = requests.post(
+            resp = _SESSION.post(
                 url=_MELLON_GRAPHQL_API_URL,
                 json=query_params,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
             )
 
             # Raise for status
             resp.raise_for_status()
             data = resp.json()
 
+            # GraphQL reports query errors (e.g. unknown fields) with a 200
+            if data.get("errors"):
+                raise ValueError(f"Mellon GraphQL errors: {data['errors']}")
+
             # Get totalCount
             return data["data"]["grantSearch"]["totalCount"]
 
@@ -167,59 +188,29 @@ class Mellon(DataSource):
         df: pd.DataFrame,
         query: str | None = None,
     ) -> pd.DataFrame:
-        # Format all dates as date iso format
-        df[DatasetFields.year] = df["dateAwarded"].apply(
-            DataSource._format_date_for_pynder_standard,
-            fmt="year",
-        )
-
-        # Add columns for query and source
-        df[DatasetFields.query] = query
-        df[DatasetFields.source] = "Mellon Foundation"
-
-        # Rename columns to standard
-        df = df.rename(
-            columns={
-                "grantee": DatasetFields.institution,
-                "description": DatasetFields.abstract,
-                "estimatedTotalAmt": DatasetFields.amount,
-                "grantMakingArea": DatasetFields.program,
-            }
-        )
+        # Build the standardized dataframe in a single construction
+        # rather than adding, renaming, and reselecting columns one by one
+        formatted = {
+            DatasetFields.institution: df["grantee"],
+            DatasetFields.year: DataSource._format_dates_for_pynder_standard(
+                df["dateAwarded"],
+                fmt="year",
+                date_format="ISO8601",
+            ),
+            DatasetFields.program: df["grantMakingArea"],
+            DatasetFields.amount: df["amount"],
+            DatasetFields.id_: df["id"],
+            DatasetFields.title: df["title"],
+            DatasetFields.abstract: df["description"],
+            DatasetFields.query: query,
+            DatasetFields.source: "Mellon Foundation",
+        }
 
         # Make empty columns for the rest of the required fields
-        for field in ALL_DATASET_FIELDS:
-            if field not in df.columns:
-                df[field] = None
+        for field in ALL_DATASET_FIELDS_SET - formatted.keys():
+            formatted[field] = None
 
-        # Create new dataframe with only the columns we want
-        return df[ALL_DATASET_FIELDS]
-
-    @staticmethod
-    def _get_funded_amount_for_grant(grant_id: str) -> float:
-        # Copy and update params
-        params = deepcopy(_DEFAULT_SINGLE_PARAMS)
-        params["variables"]["grantId"] = grant_id
-
-        try:
-            # Make the request
-            resp = requests.post(
-                url=_MELLON_GRAPHQL_API_URL,
-                json=params,
-            )
-
-            # Raise for status
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Sleep for a second
-            time.sleep(2)
-
-            # Process results
-            return data["data"]["grantDetails"]["grant"]["amount"]
-
-        except Exception as e:
-            raise ValueError(f"Error while fetching grant amount: {e}") from e
+        return pd.DataFrame(formatted, columns=ALL_DATASET_FIELDS)
 
     @staticmethod
     def _get_chunk(
@@ -239,26 +230,31 @@ class Mellon(DataSource):
 
         try:
             # Make the request
-            resp = requests.post(
+            resp = _SESSION.post(
                 url=_MELLON_GRAPHQL_API_URL,
                 json=query_params,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
             )
 
             # Raise for status
             resp.raise_for_status()
             data = resp.json()
 
-            # Process results
+            # GraphQL reports query errors (e.g. unknown fields) with a 200
+            if data.get("errors"):
+                raise ValueError(f"Mellon GraphQL errors: {data['errors']}")
+
+            # Process results column-wise so no per-row dicts need to be merged
+            entities = [
+                item["data"] for item in data["data"]["grantSearch"]["entities"]
+            ]
             chunk = pd.DataFrame(
-                [item["data"] for item in data["data"]["grantSearch"]["entities"]]
+                {
+                    field: [entity.get(field) for entity in entities]
+                    for field in _GRANT_FIELDS
+                }
             )
 
-            # Sleep for a second
-            time.sleep(2)
-
-            # Make API calls for amount funded
-            chunk["amount"] = chunk["id"].apply(Mellon._get_funded_amount_for_grant)
-
             return Mellon._format_dataframe(chunk, query=query)
 
         except Exception as e:
@@ -312,30 +308,37 @@ class Mellon(DataSource):
             to_datetime=to_datetime,
         )
 
-        # Cache dataframe results as they return
+        # Fetch all chunks concurrently, collecting them back in offset order
         results = []
-        for offset in tqdm(
-            range(0, total_grants, _DEFAULT_CHUNK_SIZE),
-            **(tqdm_kwargs or {}),
-        ):
-            # Get the chunk
-            chunk = Mellon._get_chunk(
-                query=query,
-                from_datetime=from_datetime,
-                to_datetime=to_datetime,
-                offset=offset,
-                raise_on_error=raise_on_error,
-            )
+        with ThreadPoolExecutor(max_workers=_DEFAULT_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    Mellon._get_chunk,
+                    query=query,
+                    from_datetime=from_datetime,
+                    to_datetime=to_datetime,
+                    offset=offset,
+                    raise_on_error=raise_on_error,
+                )
+                for offset in range(0, total_grants, _DEFAULT_CHUNK_SIZE)
+            ]
+            for future in tqdm(futures, **(tqdm_kwargs or {})):
+                # Get the chunk
+                chunk = future.result()
 
-            # If chunk is None, continue
-            if chunk is None:
-                continue
+                # If chunk is None, continue
+                if chunk is None:
+                    continue
 
-            # Append to results
-            results.append(chunk)
+                # Append to results
+                results.append(chunk)
 
         # Concatenate all results
         if len(results) == 0:
             return pd.DataFrame(columns=ALL_DATASET_FIELDS)
 
-        return pd.concat(results, ignore_index=True)
+        # A single chunk is already in standard form, skip the concat copy
+        if len(results) == 1:
+            return results[0]
+
+        return pd.concat(results, ignore_index=True, sort=False)
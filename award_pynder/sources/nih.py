@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import logging
-import time
-from copy import deepcopy
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
-from .base import ALL_DATASET_FIELDS, DatasetFields, DataSource
+from .base import (
+    ALL_DATASET_FIELDS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DatasetFields,
+    DataSource,
+)
 
 ###############################################################################
 
@@ -20,10 +24,10 @@ log = logging.getLogger(__name__)
 ###############################################################################
 
 _NIH_API_URL = "https://api.reporter.nih.gov/v2/projects/Search"
+# Only request fields which map into the award_pynder standard
 _DEFAULT_METADATA_SET = [
     "Organization",
     "ProjectNum",
-    "ProjectSerialNum",
     "FiscalYear",
     "ProjectStartDate",
     "ProjectEndDate",
@@ -32,26 +36,19 @@ _DEFAULT_METADATA_SET = [
     "AbstractText",
     "ContactPiName",
     "AwardAmount",
-    "AwardNoticeDate",
+]
+# Results come back keyed by the snake_case form of each requested field
+_RESULT_FIELDS = [
+    re.sub(r"(?<!^)(?=[A-Z])", "_", field).lower() for field in _DEFAULT_METADATA_SET
 ]
 _DEFAULT_CHUNK_SIZE = 500
-_DEFAULT_PARAMS: dict = {
-    "criteria": {
-        "award_notice_date": {
-            "from_date": None,
-            "to_date": None,
-        },
-        "exclude_subprojects": True,
-        "advanced_text_search": {
-            "search_text": None,
-            "operator": "advanced",
-            "search_field": "abstracttext",
-        },
-    },
-    "include_fields": _DEFAULT_METADATA_SET,
-    "limit": _DEFAULT_CHUNK_SIZE,
-    "offset": 0,
-}
+_DEFAULT_MAX_WORKERS = 4
+
+_SESSION = DataSource._create_session(pool_maxsize=_DEFAULT_MAX_WORKERS)
+
+# The NIH RePORTER API asks for no more than one request per second,
+# cached responses are served without waiting
+DataSource._register_rate_limiter(_NIH_API_URL, min_interval=1.0)
 
 ###############################################################################
 
@@ -72,19 +69,28 @@ class NIH(DataSource):
         limit: int = _DEFAULT_CHUNK_SIZE,
     ) -> dict:
         """Format the full API string with query parameters."""
-        # Fill info with always known values
-        params = deepcopy(_DEFAULT_PARAMS)
-        params["criteria"]["award_notice_date"]["from_date"] = (
-            NIH._format_datetime(from_datetime) if from_datetime else None
-        )
-        params["criteria"]["award_notice_date"]["to_date"] = (
-            NIH._format_datetime(to_datetime) if to_datetime else None
-        )
-        params["criteria"]["advanced_text_search"]["search_text"] = query or ""
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return params
+        # Build params directly rather than copying a template each request
+        return {
+            "criteria": {
+                "award_notice_date": {
+                    "from_date": (
+                        NIH._format_datetime(from_datetime) if from_datetime else None
+                    ),
+                    "to_date": (
+                        NIH._format_datetime(to_datetime) if to_datetime else None
+                    ),
+                },
+                "exclude_subprojects": True,
+                "advanced_text_search": {
+                    "search_text": query or "",
+                    "operator": "advanced",
+                    "search_field": "abstracttext",
+                },
+            },
+            "include_fields": _DEFAULT_METADATA_SET,
+            "limit": limit,
+            "offset": offset,
+        }
 
     @staticmethod
     def _format_dataframe(
@@ -92,11 +98,13 @@ class NIH(DataSource):
         query: str | None = None,
     ) -> pd.DataFrame:
         # Format all dates as date iso format
-        df[DatasetFields.start] = df["project_start_date"].apply(
-            DataSource._format_date_for_pynder_standard,
+        df[DatasetFields.start] = DataSource._format_dates_for_pynder_standard(
+            df["project_start_date"],
+            date_format="ISO8601",
         )
-        df[DatasetFields.end] = df["project_end_date"].apply(
-            DataSource._format_date_for_pynder_standard,
+        df[DatasetFields.end] = DataSource._format_dates_for_pynder_standard(
+            df["project_end_date"],
+            date_format="ISO8601",
         )
 
         # Add columns for query and source
@@ -124,31 +132,49 @@ class NIH(DataSource):
         return df[ALL_DATASET_FIELDS]
 
     @staticmethod
-    def _query_total_grants(
+    def _fetch_chunk(
         query: str | None,
         from_datetime: str | datetime | None,
         to_datetime: str | datetime | None,
-    ) -> int:
-        try:
-            # Construct params for a single query
-            params = NIH._format_query(
-                query=query,
-                from_datetime=from_datetime,
-                to_datetime=to_datetime,
-                offset=0,
-                limit=1,
-            )
+        offset: int,
+        use_cache: bool = False,
+    ) -> tuple[pd.DataFrame | None, int]:
+        # Construct the query string
+        params = NIH._format_query(
+            query=query,
+            from_datetime=from_datetime,
+            to_datetime=to_datetime,
+            offset=offset,
+        )
 
-            # Make the request
-            resp = requests.post(_NIH_API_URL, json=params)
+        # Make the request
+        session = DataSource._get_cached_session() if use_cache else _SESSION
+        resp = session.post(
+            _NIH_API_URL,
+            json=params,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+        )
 
-            # Get the data
-            data = resp.json()
+        # Get the data, skipping the frame entirely when nothing came back
+        data = resp.json()
+        results = data["results"]
+        if len(results) == 0:
+            return None, data["meta"]["total"]
 
-            return data["meta"]["total"]
+        # Build the frame column-wise
+        columns = {
+            field: [result.get(field) for result in results] for field in _RESULT_FIELDS
+        }
 
-        except Exception as e:
-            raise ValueError(f"Error while fetching total grants: {e}") from e
+        # Organization is nested, only keep the org_name
+        columns["organization"] = [
+            result["organization"]["org_name"] for result in results
+        ]
+        return_data = pd.DataFrame(columns)
+
+        # Formatting happens once all chunks have been fetched,
+        # every response also reports the total number of matching grants
+        return return_data, data["meta"]["total"]
 
     @staticmethod
     def _get_chunk(
@@ -157,38 +183,17 @@ class NIH(DataSource):
         to_datetime: str | datetime | None = None,
         offset: int = 0,
         raise_on_error: bool = True,
+        use_cache: bool = False,
     ) -> pd.DataFrame | None:
-        # Construct the query string
-        params = NIH._format_query(
-            query=query,
-            from_datetime=from_datetime,
-            to_datetime=to_datetime,
-            offset=offset,
-        )
-
         try:
-            # Make the request
-            resp = requests.post(_NIH_API_URL, json=params)
-
-            # Get the data
-            data = resp.json()["results"]
-
-            # For each result, extract the org_name and change nulls to None
-            rows = []
-            for result in data:
-                result["organization"] = result["organization"]["org_name"]
-                rows.append(result)
-
-            if len(rows) > 0:
-                return_data = pd.DataFrame(rows)
-            else:
-                # If no data, return empty dataframe
-                return_data = pd.DataFrame(columns=_DEFAULT_METADATA_SET)
-
-            # Sleep for a second
-            time.sleep(2)
-
-            return NIH._format_dataframe(return_data, query=query)
+            chunk, _ = NIH._fetch_chunk(
+                query=query,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                offset=offset,
+                use_cache=use_cache,
+            )
+            return chunk
 
         except Exception as e:
             # Handle raise on error or ignore
@@ -210,6 +215,7 @@ class NIH(DataSource):
         to_datetime: str | datetime | None = None,
         raise_on_error: bool = True,
         tqdm_kwargs: dict | None = None,
+        use_cache: bool = False,
     ) -> pd.DataFrame:
         """
         Get data from the National Institute of Health.
@@ -226,6 +232,9 @@ class NIH(DataSource):
             Whether to raise an error if the request fails.
         tqdm_kwargs : dict, optional
             Keyword arguments to pass to tqdm.
+        use_cache : bool, optional
+            Whether to cache responses on disk and reuse cached responses for
+            identical requests made within the cache expiration window.
 
         Returns
         -------
@@ -233,16 +242,19 @@ class NIH(DataSource):
             All grants from the National Institute of Health for the specified time
             period and query, formatted into award_pynder standard format.
         """
-        # Continuously get chunks of data
-        offset = 0
-        chunks: list[pd.DataFrame] = []
-
-        # Get total
-        total = NIH._query_total_grants(
-            query=query,
-            from_datetime=from_datetime,
-            to_datetime=to_datetime,
-        )
+        # Get the first chunk, which also tells us the total
+        try:
+            first_chunk, total = NIH._fetch_chunk(
+                query=query,
+                from_datetime=from_datetime,
+                to_datetime=to_datetime,
+                offset=0,
+                use_cache=use_cache,
+            )
+        except Exception as e:
+            raise ValueError(
+                f"Error while fetching total grants and first chunk: {e}"
+            ) from e
 
         # Handle too many
         if total >= 10000:
@@ -251,28 +263,37 @@ class NIH(DataSource):
                 "Please narrow your search."
             )
 
-        # Iter chunks
-        for offset in tqdm(
-            range(0, total, _DEFAULT_CHUNK_SIZE),
-            **(tqdm_kwargs or {}),
-        ):
-            # Get the chunk
-            chunk = NIH._get_chunk(
-                query=query,
-                from_datetime=from_datetime,
-                to_datetime=to_datetime,
-                offset=offset,
-                raise_on_error=raise_on_error,
-            )
-
-            # If chunk is None, continue
-            if chunk is None:
-                continue
-
-            chunks.append(chunk)
-
-        # Concatenate the chunks
-        if len(chunks) == 0:
+        # Handle none found
+        if total == 0 or first_chunk is None:
             return pd.DataFrame(columns=ALL_DATASET_FIELDS)
 
-        return pd.concat(chunks, ignore_index=True).reset_index(drop=True)
+        # Fetch the remaining chunks concurrently, collecting them in offset order
+        chunks = [first_chunk]
+        with ThreadPoolExecutor(max_workers=_DEFAULT_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    NIH._get_chunk,
+                    query=query,
+                    from_datetime=from_datetime,
+                    to_datetime=to_datetime,
+                    offset=offset,
+                    raise_on_error=raise_on_error,
+                    use_cache=use_cache,
+                )
+                for offset in range(_DEFAULT_CHUNK_SIZE, total, _DEFAULT_CHUNK_SIZE)
+            ]
+            for future in tqdm(futures, **(tqdm_kwargs or {})):
+                # Get the chunk
+                chunk = future.result()
+
+                # If chunk is None, continue
+                if chunk is None:
+                    continue
+
+                chunks.append(chunk)
+
+        # Format the combined raw data in a single pass
+        return NIH._format_dataframe(
+            pd.concat(chunks, ignore_index=True, sort=False),
+            query=query,
+        )
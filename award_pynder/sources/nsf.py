@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
-from .base import ALL_DATASET_FIELDS, DatasetFields, DataSource
+from .base import (
+    ALL_DATASET_FIELDS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DatasetFields,
+    DataSource,
+)
 
 ###############################################################################
 
@@ -18,6 +22,7 @@ log = logging.getLogger(__name__)
 
 ###############################################################################
 
+# Only request fields which map into the award_pynder standard
 _DEFAULT_METADATA_SET = [
     "id",
     "date",
@@ -30,20 +35,29 @@ _DEFAULT_METADATA_SET = [
     "cfdaNumber",
     "estimatedTotalAmt",
     "abstractText",
-    "piEmail",
-    # "fundProgramCode",
-    # "awardeeCounty",
 ]
 
 _DEFAULT_CHUNK_SIZE = 25
+_DEFAULT_MAX_WORKERS = 4
+
+_NSF_DATE_FORMAT = "%m/%d/%Y"
 
-_NSF_API_URL_TEMPLATE = (
-    "https://api.nsf.gov/services/v1/awards.json?"
-    "&printFields={metadata_fields}"
-    "&projectOutcomesOnly={require_project_outcomes_reports}"
-    "&offset={offset}"
+# With no total to plan from, give up after this many failed pages in a row
+_MAX_CONSECUTIVE_FAILURES = 2 * _DEFAULT_MAX_WORKERS
+
+# The requested fields never change so bake them into the base URL once
+_METADATA_FIELDS_JOINED = ",".join(_DEFAULT_METADATA_SET)
+_NSF_API_URL = (
+    "https://api.nsf.gov/services/v1/awards.json"
+    f"?printFields={_METADATA_FIELDS_JOINED}"
 )
 
+_SESSION = DataSource._create_session(pool_maxsize=_DEFAULT_MAX_WORKERS)
+
+# Pages are requested concurrently, NSF doesn't publish a rate limit so keep
+# to one request per second like NIH, cached responses don't wait
+DataSource._register_rate_limiter(_NSF_API_URL, min_interval=1.0)
+
 ###############################################################################
 # LUTs
 
@@ -86,7 +100,7 @@ class NSF(DataSource):
 
     @staticmethod
     def _format_datetime(dt: str | datetime) -> str:
-        return DataSource._parse_datetime(dt).strftime("%m/%d/%Y")
+        return DataSource._parse_datetime(dt).strftime(_NSF_DATE_FORMAT)
 
     @staticmethod
     def _format_query(
@@ -96,30 +110,26 @@ class NSF(DataSource):
         cfda_number: str | None,
         require_project_outcomes_reports: bool,
         offset: int,
-    ) -> str:
-        # Fill info with always known values
-        metadata_fields = ",".join(_DEFAULT_METADATA_SET)
-        api_str = _NSF_API_URL_TEMPLATE.format(
-            metadata_fields=metadata_fields,
-            require_project_outcomes_reports=require_project_outcomes_reports,
-            offset=offset,
-        )
+    ) -> dict:
+        # Fill params with always known values
+        params: dict = {
+            "projectOutcomesOnly": require_project_outcomes_reports,
+            "offset": offset,
+        }
 
         # Handle optional parameters
         if from_datetime:
             # Parse and format
-            from_dt = NSF._format_datetime(from_datetime)
-            api_str += f"&dateStart={from_dt}"
+            params["dateStart"] = NSF._format_datetime(from_datetime)
         if to_datetime:
             # Parse and format
-            to_dt = NSF._format_datetime(to_datetime)
-            api_str += f"&dateEnd={to_dt}"
+            params["dateEnd"] = NSF._format_datetime(to_datetime)
         if cfda_number:
-            api_str += f"&cfdaNumber={cfda_number}"
+            params["cfdaNumber"] = cfda_number
         if query:
-            api_str += f"&keyword={query}"
+            params["keyword"] = query
 
-        return api_str
+        return params
 
     @staticmethod
     def _format_dataframe(
@@ -127,19 +137,25 @@ class NSF(DataSource):
         query: str | None = None,
     ) -> pd.DataFrame:
         # Create column of first and last name combined
-        df[DatasetFields.pi] = df["piFirstName"] + " " + df["piLastName"]
+        df[DatasetFields.pi] = df["piFirstName"].str.cat(df["piLastName"], sep=" ")
 
         # Drop piFirstName and piLastName columns
         df = df.drop(columns=["piFirstName", "piLastName"])
 
         # Format all dates as date iso format
-        df["startDate"] = df["startDate"].apply(
-            DataSource._format_date_for_pynder_standard
+        # NSF always returns dates as MM/DD/YYYY so skip format inference
+        df["startDate"] = DataSource._format_dates_for_pynder_standard(
+            df["startDate"],
+            date_format=_NSF_DATE_FORMAT,
+        )
+        df["expDate"] = DataSource._format_dates_for_pynder_standard(
+            df["expDate"],
+            date_format=_NSF_DATE_FORMAT,
         )
-        df["expDate"] = df["expDate"].apply(DataSource._format_date_for_pynder_standard)
-        df["date"] = df["date"].apply(
-            DataSource._format_date_for_pynder_standard,
+        df["date"] = DataSource._format_dates_for_pynder_standard(
+            df["date"],
             fmt="year",
+            date_format=_NSF_DATE_FORMAT,
         )
 
         # Add columns for query and source
@@ -171,9 +187,10 @@ class NSF(DataSource):
         require_project_outcomes_reports: bool = False,
         offset: int = 0,
         raise_on_error: bool = True,
-    ) -> pd.DataFrame | None:
-        # Construct the query string
-        api_str = NSF._format_query(
+        use_cache: bool = False,
+    ) -> tuple[pd.DataFrame | None, bool]:
+        # Construct the query params
+        params = NSF._format_query(
             query=query,
             from_datetime=from_datetime,
             to_datetime=to_datetime,
@@ -183,21 +200,32 @@ class NSF(DataSource):
         )
 
         try:
-            # Make the request
-            resp = requests.get(api_str)
-
-            # Get the data
-            data = resp.json()["response"]
-            if "award" in data:
-                return_data = pd.DataFrame(data["award"])
-            else:
-                # If no data, return empty dataframe
-                return_data = pd.DataFrame(columns=_DEFAULT_METADATA_SET)
+            # Make the request, the session paces sends to the NSF host and
+            # its retries back off on 429 and honor Retry-After
+            session = DataSource._get_cached_session() if use_cache else _SESSION
+            resp = session.get(
+                _NSF_API_URL,
+                params=params,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+            )
 
-            # Sleep for a second
-            time.sleep(2)
+            # Get the data, a page with fewer awards than the chunk size is
+            # the last page and past it there is nothing to build
+            awards = resp.json()["response"].get("award", [])
+            reached_end = len(awards) < _DEFAULT_CHUNK_SIZE
+            if len(awards) == 0:
+                return None, reached_end
+
+            # Build the frame column-wise
+            return_data = pd.DataFrame(
+                {
+                    field: [award.get(field) for award in awards]
+                    for field in _DEFAULT_METADATA_SET
+                }
+            )
 
-            return NSF._format_dataframe(return_data, query=query)
+            # Formatting happens once all chunks have been fetched
+            return return_data, reached_end
 
         except Exception as e:
             # Handle raise on error or ignore
@@ -209,8 +237,8 @@ class NSF(DataSource):
                 f"'raise_on_error' is False, ignoring..."
             )
 
-        # Default return but make this strict
-        return None
+        # Failed pages have no data and say nothing about the end of results
+        return None, False
 
     @staticmethod
     def get_data(
@@ -221,6 +249,7 @@ class NSF(DataSource):
         require_project_outcomes_reports: bool = False,
         raise_on_error: bool = True,
         tqdm_kwargs: dict | None = None,
+        use_cache: bool = False,
     ) -> pd.DataFrame:
         """
         Get data from the National Science Foundation.
@@ -241,6 +270,9 @@ class NSF(DataSource):
             Whether to raise an error if the request fails.
         tqdm_kwargs : dict, optional
             Keyword arguments to pass to tqdm.
+        use_cache : bool, optional
+            Whether to cache responses on disk and reuse cached responses for
+            identical requests made within the cache expiration window.
 
         Returns
         -------
@@ -248,37 +280,77 @@ class NSF(DataSource):
             All grants from the National Science Foundation for the specified time
             period and query, formatted into award_pynder standard format.
         """
-        # Continuously get chunks of data
+        # Continuously get batches of chunks of data, the pages in each
+        # batch are fetched concurrently since there is no total to plan from
         offset = 1
         chunks: list[pd.DataFrame] = []
+        seen_ids: set[str] = set()
         with tqdm(desc="Fetching NSF data", **(tqdm_kwargs or {})) as pbar:
-            while True:
-                # Get the chunk
-                chunk = NSF._get_chunk(
-                    query=query,
-                    from_datetime=from_datetime,
-                    to_datetime=to_datetime,
-                    cfda_number=cfda_number,
-                    require_project_outcomes_reports=require_project_outcomes_reports,
-                    offset=offset,
-                    raise_on_error=raise_on_error,
-                )
-                chunks.append(chunk)
-
-                # Break if less than chunk size
-                if chunk is not None and len(chunk) < _DEFAULT_CHUNK_SIZE:
-                    break
-
-                # Update state
-                offset += _DEFAULT_CHUNK_SIZE
-                pbar.update(1)
-
-        # Concatenate the chunks
+            is_last_batch = False
+            consecutive_failures = 0
+            with ThreadPoolExecutor(max_workers=_DEFAULT_MAX_WORKERS) as executor:
+                while not is_last_batch:
+                    # Get the batch of chunks
+                    futures = [
+                        executor.submit(
+                            NSF._get_chunk,
+                            query=query,
+                            from_datetime=from_datetime,
+                            to_datetime=to_datetime,
+                            cfda_number=cfda_number,
+                            require_project_outcomes_reports=(
+                                require_project_outcomes_reports
+                            ),
+                            offset=offset + (i * _DEFAULT_CHUNK_SIZE),
+                            raise_on_error=raise_on_error,
+                            use_cache=use_cache,
+                        )
+                        for i in range(_DEFAULT_MAX_WORKERS)
+                    ]
+
+                    # Collect in offset order, pages after the last page are empty
+                    for future in futures:
+                        chunk, reached_end = future.result()
+
+                        # Skip failed pages (already logged), but with no total to
+                        # go on stop if the API keeps failing
+                        if chunk is None and not reached_end:
+                            consecutive_failures += 1
+                            if consecutive_failures >= _MAX_CONSECUTIVE_FAILURES:
+                                log.error(
+                                    f"{consecutive_failures} consecutive NSF pages "
+                                    f"failed, stopping early; results may be incomplete"
+                                )
+                                is_last_batch = True
+                                break
+
+                            continue
+                        consecutive_failures = 0
+
+                        # Drop awards already returned by previous pages
+                        if chunk is not None:
+                            chunk = chunk[~chunk["id"].isin(seen_ids)].drop_duplicates(
+                                subset="id"
+                            )
+                            if len(chunk) > 0:
+                                seen_ids.update(chunk["id"])
+                                chunks.append(chunk)
+
+                        # Stop at the last page, later pages in the batch are empty
+                        if reached_end:
+                            is_last_batch = True
+                            break
+
+                    # Update state
+                    offset += _DEFAULT_MAX_WORKERS * _DEFAULT_CHUNK_SIZE
+                    pbar.update(len(futures))
+
+        # Handle none found
         if len(chunks) == 0:
             return pd.DataFrame(columns=ALL_DATASET_FIELDS)
 
-        return (
-            pd.concat(chunks, ignore_index=True)
-            .drop_duplicates(subset="id")
-            .reset_index(drop=True)
+        # Format the combined raw data in a single pass
+        return NSF._format_dataframe(
+            pd.concat(chunks, ignore_index=True),
+            query=query,
         )
@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import logging
-import time
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
+import lxml.html
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from tqdm import tqdm
 
-from .base import ALL_DATASET_FIELDS, DatasetFields, DataSource
+from .base import (
+    ALL_DATASET_FIELDS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DatasetFields,
+    DataSource,
+)
 
 ###############################################################################
 
@@ -28,6 +37,65 @@ _SLOAN_API_URL = (
     "&page={page}"
 )
 _DEFAULT_CHUNK_SIZE = 3000
+_DEFAULT_MAX_WORKERS = 4
+
+# Pages are fetched concurrently over one kept-alive connection pool
+_SESSION = DataSource._create_session(pool_maxsize=_DEFAULT_MAX_WORKERS)
+
+# Keep the same politeness as the previous serial crawl, at most one request
+# sent every two seconds across all workers, cached responses don't wait
+DataSource._register_rate_limiter(_SLOAN_API_URL, min_interval=2.0)
+
+# Fields scraped from each grant in the data list
+_CHUNK_FIELDS = [
+    DatasetFields.institution,
+    DatasetFields.amount,
+    DatasetFields.year,
+    DatasetFields.title,
+    DatasetFields.id_,
+    DatasetFields.program,
+    DatasetFields.pi,
+]
+
+# Numeric fields are kept as nullable typed columns rather than object
+_COLUMN_DTYPES = {
+    DatasetFields.year: "Int64",
+    DatasetFields.amount: "Float64",
+    DatasetFields.id_: "Int64",
+}
+
+# Total number of grants shown in the results count cell
+_TOTAL_RE = re.compile(
+    r"class=\"[^\"]*\bresults-count\b[^\"]*\"[^>]*>\s*([\d,]+)\s*Grants"
+)
+# Only build the results count cell when the regex misses, strainers see the
+# raw class attribute so match the class as one of possibly many
+_TOTAL_STRAINER = SoupStrainer(
+    "td",
+    class_=re.compile(r"(^|\s)results-count(\s|$)"),
+)
+
+# Labels and currency formatting removed from numbers before casting
+_NON_AMOUNT_RE = re.compile(r"[^\d.]")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def _has_class(name: str) -> str:
+    # XPath equivalent of a CSS class selector (matches one of many classes)
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compile the XPath expressions used for every grant once at import
+_AWARDS_XP = etree.XPath(f"(//ul[{_has_class('data-list')}])[1]/li")
+_GRANTEE_XP = etree.XPath(f"string(.//header//div[{_has_class('grantee')}])")
+_AMOUNT_XP = etree.XPath(f"string(.//header//div[{_has_class('amount')}])")
+_YEAR_XP = etree.XPath(f"string(.//header//div[{_has_class('year')}])")
+_DETAILS_XP = etree.XPath(f"(.//div[{_has_class('details')}])[1]")
+_DESCRIPTION_XP = etree.XPath(f"string(.//div[{_has_class('brief-description')}])")
+_PROGRAM_XP = etree.XPath(f"string(((.//div[{_has_class('grid')}])[1]//ul)[1]//li)")
+_SUB_PROGRAM_AND_PI_XP = etree.XPath(
+    f"string(((.//div[{_has_class('grid')}])[1]//ul)[2])"
+)
 
 ###############################################################################
 
@@ -36,6 +104,7 @@ class Sloan(DataSource):
     """Data source for the Sloan Foundation."""
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _format_query(
         query: str | None,
         offset: int,
@@ -59,17 +128,15 @@ class Sloan(DataSource):
         df[DatasetFields.query] = query
         df[DatasetFields.source] = "Sloan"
 
-        # Add missing columns
-        for col in ALL_DATASET_FIELDS:
-            if col not in df:
-                df[col] = None
-
-        # Create new dataframe with only the columns we want
-        return df[ALL_DATASET_FIELDS]
+        # Add missing columns and order to standard in a single reindex,
+        # then store the numeric fields as nullable typed columns
+        return df.reindex(columns=ALL_DATASET_FIELDS).astype(_COLUMN_DTYPES)
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _query_total_grants(
         query: str | None,
+        use_cache: bool = False,
     ) -> int:
         try:
             # Construct params for a single query
@@ -80,10 +147,16 @@ class Sloan(DataSource):
             )
 
             # Make the request
-            resp = requests.get(query_url)
+            session = DataSource._get_cached_session() if use_cache else _SESSION
+            resp = session.get(query_url, timeout=DEFAULT_REQUEST_TIMEOUT)
+
+            # The count is usually plain text in the td, so try a regex first
+            match = _TOTAL_RE.search(resp.text)
+            if match is not None:
+                return int(match.group(1).replace(",", ""))
 
-            # Parse HTML for td with "results-count" class
-            soup = BeautifulSoup(resp.text, "html.parser")
+            # Otherwise parse HTML for td with "results-count" class
+            soup = BeautifulSoup(resp.content, "lxml", parse_only=_TOTAL_STRAINER)
             return int(
                 soup.find(
                     "td",
@@ -102,7 +175,8 @@ class Sloan(DataSource):
         query: str | None = None,
         offset: int = 1,
         raise_on_error: bool = True,
-    ) -> pd.DataFrame | None:
+        use_cache: bool = False,
+    ) -> dict[str, list] | None:
         # Construct the query string
         query_url = Sloan._format_query(
             query=query,
@@ -111,86 +185,60 @@ class Sloan(DataSource):
 
         try:
             # Make the request
-            resp = requests.get(query_url)
+            session = DataSource._get_cached_session() if use_cache else _SESSION
+            resp = session.get(query_url, timeout=DEFAULT_REQUEST_TIMEOUT)
 
-            # Convert to soup
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Find the data list container
-            data_list = soup.find("ul", class_="data-list")
-            awards = data_list.find_all("li", recursive=False)
-
-            # Iter over each li to collect rows
-            rows = []
-            for li in awards:
-                # Get the header info
-                header = li.find("header")
+            # Parse straight into an lxml tree
+            doc = lxml.html.fromstring(resp.content)
 
+            # Iter over each li in the data list container,
+            # collecting values column-wise
+            columns: dict[str, list] = {field: [] for field in _CHUNK_FIELDS}
+            for li in _AWARDS_XP(doc):
                 # Collect the grantee information (stored in div.grantee)
-                grantee = header.find("div", class_="grantee").text
-                grantee = grantee.replace("grantee: ", "").strip()
+                grantee = _GRANTEE_XP(li)
+                grantee = grantee.strip().removeprefix("grantee: ").strip()
 
                 # Collect the amount information (stored in div.amount)
-                amount = header.find("div", class_="amount").text
-                amount = float(
-                    amount.replace("amount: ", "")
-                    .replace("$", "")
-                    .replace(",", "")
-                    .strip()
-                )
+                amount = _AMOUNT_XP(li)
+                amount = float(_NON_AMOUNT_RE.sub("", amount))
 
                 # Collect the year information (stored in div.year)
-                year = header.find("div", class_="year").text
-                year = int(year.replace("year: ", "").strip())
+                year = _YEAR_XP(li)
+                year = int(_NON_DIGIT_RE.sub("", year))
 
                 # Get the details info
-                details = li.find("div", class_="details")
+                details = _DETAILS_XP(li)[0]
 
                 # Collect the description (stored in the div "brief-description")
-                description = details.find(
-                    "div", class_="brief-description"
-                ).text.strip()
+                description = _DESCRIPTION_XP(details).strip()
 
                 # Collect the id (stored in the div attribute
                 # "data-accordian-group" for div with class "details")
-                id_ = details["data-accordian-group"].replace("grant-", "").strip()
-
-                # Find the grid
-                grid = details.find("div", class_="grid")
+                id_ = details.get("data-accordian-group").strip().removeprefix("grant-")
 
                 # Collect the program (stored in div.grid > first ul > first li)
-                program = grid.find("ul").find("li").text
-                program = program.replace("Program", "").strip()
+                program = _PROGRAM_XP(details)
+                program = program.strip().removeprefix("Program").strip()
 
                 # Take all of the text from the second ul
-                sub_program_and_pi = grid.find_all("ul")[1].text.strip()
-
-                # Find the index of the word "Investigator"
-                pi_index = sub_program_and_pi.find("Investigator")
+                sub_program_and_pi = _SUB_PROGRAM_AND_PI_XP(details).strip()
 
                 # Only keep text after the word "Investigator"
-                pi = sub_program_and_pi[pi_index + len("Investigator") :].strip()
+                _, _, pi = sub_program_and_pi.partition("Investigator")
+                pi = pi.strip()
 
                 # Add row
-                rows.append(
-                    {
-                        DatasetFields.institution: grantee,
-                        DatasetFields.amount: amount,
-                        DatasetFields.year: year,
-                        DatasetFields.title: description,
-                        DatasetFields.id_: int(id_),
-                        DatasetFields.program: program,
-                        DatasetFields.pi: pi,
-                    }
-                )
+                columns[DatasetFields.institution].append(grantee)
+                columns[DatasetFields.amount].append(amount)
+                columns[DatasetFields.year].append(year)
+                columns[DatasetFields.title].append(description)
+                columns[DatasetFields.id_].append(int(id_))
+                columns[DatasetFields.program].append(program)
+                columns[DatasetFields.pi].append(pi)
 
-            # Sleep for a second
-            time.sleep(2)
-
-            return Sloan._format_dataframe(
-                pd.DataFrame(rows),
-                query=query,
-            )
+            # The frame is built once all chunks have been fetched
+            return columns
 
         except Exception as e:
             # Handle raise on error or ignore
@@ -212,6 +260,7 @@ class Sloan(DataSource):
         to_datetime: str | datetime | None = None,
         raise_on_error: bool = True,
         tqdm_kwargs: dict | None = None,
+        use_cache: bool = False,
     ) -> pd.DataFrame:
         """
         Get data from the Sloan Foundation.
@@ -228,6 +277,9 @@ class Sloan(DataSource):
             Whether to raise an error if the request fails.
         tqdm_kwargs : dict, optional
             Keyword arguments to pass to tqdm.
+        use_cache : bool, optional
+            Whether to cache responses on disk and reuse cached responses for
+            identical requests made within the cache expiration window.
 
         Returns
         -------
@@ -235,43 +287,55 @@ class Sloan(DataSource):
             All grants from the Sloan Foundation for the specified time
             period and query, formatted into award_pynder standard format.
         """
-        # Continuously get chunks of data
-        offset = 0
-        chunks: list[pd.DataFrame] = []
-
         # Get total
         total = Sloan._query_total_grants(
             query=query,
+            use_cache=use_cache,
         )
 
-        # Iter chunks
-        for offset in tqdm(
-            range(0, total, _DEFAULT_CHUNK_SIZE),
-            **(tqdm_kwargs or {}),
-        ):
-            # Get the chunk
-            chunk = Sloan._get_chunk(
-                query=query,
-                offset=offset,
-                raise_on_error=raise_on_error,
-            )
-
-            # If chunk is None, continue
-            if chunk is None:
-                continue
-
-            chunks.append(chunk)
-
-        # Concatenate the chunks
-        if len(chunks) == 0:
+        # Results are ordered newest first, so once a page reaches back past
+        # the start year every later page only holds grants that get filtered
+        from_year = Sloan._parse_datetime(from_datetime).year if from_datetime else None
+
+        # Fetch all chunks concurrently, collecting columns back in offset order
+        columns: dict[str, list] = {field: [] for field in _CHUNK_FIELDS}
+        with ThreadPoolExecutor(max_workers=_DEFAULT_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    Sloan._get_chunk,
+                    query=query,
+                    offset=offset,
+                    raise_on_error=raise_on_error,
+                    use_cache=use_cache,
+                )
+                # The offset is the 1-based page number
+                for offset in range(1, math.ceil(total / _DEFAULT_CHUNK_SIZE) + 1)
+            ]
+            for future in tqdm(futures, **(tqdm_kwargs or {})):
+                # Get the chunk
+                chunk = future.result()
+
+                # If chunk is None, continue
+                if chunk is None:
+                    continue
+
+                for field, values in chunk.items():
+                    columns[field].extend(values)
+
+                # Stop once past the start year, skipping pages not yet requested
+                years = chunk[DatasetFields.year]
+                if from_year is not None and len(years) > 0 and min(years) < from_year:
+                    executor.shutdown(cancel_futures=True)
+                    break
+
+        # Handle none found
+        if len(columns[DatasetFields.id_]) == 0:
             return pd.DataFrame(columns=ALL_DATASET_FIELDS)
 
-        # Concat and filter out years not in range
-        df = pd.concat(chunks, ignore_index=True).reset_index(drop=True)
-        if from_datetime:
-            # First parse the datetime
-            from_dt = Sloan._parse_datetime(from_datetime)
-            df = df[df[DatasetFields.year] >= from_dt.year]
+        # Build and format the frame once, then filter out years not in range
+        df = Sloan._format_dataframe(pd.DataFrame(columns), query=query)
+        if from_year is not None:
+            df = df[df[DatasetFields.year] >= from_year]
         if to_datetime:
             # First parse the datetime
             to_dt = Sloan._parse_datetime(to_datetime)
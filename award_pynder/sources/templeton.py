@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import StringIO
 
+import lxml.html
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
-from .base import ALL_DATASET_FIELDS, DatasetFields, DataSource
+from .base import (
+    ALL_DATASET_FIELDS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DatasetFields,
+    DataSource,
+)
 
 ###############################################################################
 
@@ -24,6 +32,18 @@ _DEFAULT_CHUNK_SIZE = 500
 
 _TEMPLETON_BULK_API_URL = "https://www.templeton.org/grants/grant-database"
 
+# Only the bookmark links of the query results page are needed, strainers see
+# the raw rel attribute so match bookmark as one of possibly many values
+_BOOKMARK_STRAINER = SoupStrainer("a", rel=re.compile(r"(^|\s)bookmark(\s|$)"))
+
+# Both pages live on the same host so share one kept-alive connection
+_SESSION = DataSource._create_session()
+
+_GRANT_LINKS_XP = etree.XPath(
+    "(//table[@id='grants-table'])[1]/tbody[1]//a/@href",
+    smart_strings=False,
+)
+
 ###############################################################################
 
 
@@ -66,13 +86,8 @@ class Templeton(DataSource):
             }
         )
 
-        # Add missing columns
-        for col in ALL_DATASET_FIELDS:
-            if col not in df:
-                df[col] = None
-
-        # Create new dataframe with only the columns we want
-        return df[ALL_DATASET_FIELDS]
+        # Add missing columns and keep only the columns we want, in order
+        return df.reindex(columns=ALL_DATASET_FIELDS)
 
     @staticmethod
     def get_data(
@@ -80,6 +95,7 @@ class Templeton(DataSource):
         from_datetime: str | datetime | None = None,
         to_datetime: str | datetime | None = None,
         raise_on_error: bool = True,
+        use_cache: bool = False,
     ) -> pd.DataFrame:
         """
         Get data from the Templeton Foundation.
@@ -94,6 +110,9 @@ class Templeton(DataSource):
             The end date for the search.
         raise_on_error : bool, optional
             Whether to raise an error if the request fails.
+        use_cache : bool, optional
+            Whether to cache responses on disk and reuse cached responses for
+            identical requests made within the cache expiration window.
 
         Returns
         -------
@@ -105,34 +124,41 @@ class Templeton(DataSource):
         query_url = Templeton._format_query(query=query)
 
         try:
-            # Make the request
-            resp = requests.get(query_url)
-
-            # Convert to soup
-            soup = BeautifulSoup(resp.text, "html.parser")
+            # Request the search results and the bulk grant database together,
+            # the search results only decide which bulk rows to keep
+            session = DataSource._get_cached_session() if use_cache else _SESSION
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                query_future = executor.submit(
+                    session.get,
+                    query_url,
+                    timeout=DEFAULT_REQUEST_TIMEOUT,
+                )
+                bulk_future = executor.submit(
+                    session.get,
+                    _TEMPLETON_BULK_API_URL,
+                    timeout=DEFAULT_REQUEST_TIMEOUT,
+                )
+                resp = query_future.result()
+                bulk_resp = bulk_future.result()
+
+            # Convert to soup, only building the bookmark links
+            soup = BeautifulSoup(resp.content, "lxml", parse_only=_BOOKMARK_STRAINER)
 
             # Find all a tags with rel = bookmark, keep track of the link URL
+            # as a set so the later membership check is a hash lookup
             links = soup.find_all("a", rel="bookmark")
-            relevant_link_urls = [link["href"] for link in links]
-
-            # Now query bulk API
-            resp = requests.get(_TEMPLETON_BULK_API_URL)
-
-            # Convert to soup
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Find the table with id "grants-table"
-            table = soup.find("table", id="grants-table")
+            relevant_link_urls = {link["href"] for link in links}
 
-            # Pass the table into a pandas dataframe
-            df = pd.read_html(StringIO(str(table)))[0]
+            # Read the table with id "grants-table" straight into a dataframe
+            df = pd.read_html(
+                StringIO(bulk_resp.text),
+                attrs={"id": "grants-table"},
+                flavor="lxml",
+            )[0]
 
             # Additionally attach a column for the link URL
             # Find all links by finding all "a" tags in the tbody
-            tbody = table.find("tbody")
-            links = tbody.find_all("a")
-            all_link_urls = [link["href"] for link in links]
-            df["link"] = all_link_urls
+            df["link"] = _GRANT_LINKS_XP(lxml.html.fromstring(bulk_resp.content))
 
             # Subset the dataframe to only links that we have from before
             df = df[df["link"].isin(relevant_link_urls)]
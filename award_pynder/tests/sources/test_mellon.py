@@ -1,11 +1,42 @@
 #!/usr/bin/env python
 
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from award_pynder.sources import mellon
 from award_pynder.sources.mellon import Mellon
 
 from ..utils import assert_dataset_basics
 
 ###############################################################################
 
+# GraphQL reports invalid queries with a 200 and a list of errors
+_GRAPHQL_ERROR_RESPONSE = {
+    "errors": [{"message": 'Cannot query field "amount" on type "GrantSearchResult".'}],
+    "data": None,
+}
+
+###############################################################################
+
+
+@mock.patch.object(
+    mellon._SESSION,
+    "post",
+    return_value=mock.Mock(**{"json.return_value": _GRAPHQL_ERROR_RESPONSE}),
+)
+def test_mellon_graphql_errors(mock_post: mock.Mock) -> None:
+    # Both the count and the chunk queries surface the GraphQL errors
+    with pytest.raises(ValueError, match="Cannot query field"):
+        Mellon._query_total_grants(query="graphql errors")
+    with pytest.raises(ValueError, match="Cannot query field"):
+        Mellon._get_chunk(query="graphql errors")
+
+    # Unless errors are ignored, in which case the chunk is skipped
+    assert Mellon._get_chunk(query="graphql errors", raise_on_error=False) is None
+
 
 def test_mellon() -> None:
     # Get data
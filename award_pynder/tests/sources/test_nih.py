@@ -1,5 +1,15 @@
 #!/usr/bin/env python
 
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from award_pynder.sources import nih
+from award_pynder.sources.base import ALL_DATASET_FIELDS
 from award_pynder.sources.nih import NIH
 
 from ..utils import assert_dataset_basics
@@ -7,6 +17,77 @@ from ..utils import assert_dataset_basics
 ###############################################################################
 
 
+def _result(project_id: int) -> dict:
+    # A project with every requested field filled in
+    return {
+        "organization": {"org_name": "University"},
+        "project_num": f"R01-{project_id}",
+        "fiscal_year": 2023,
+        "project_start_date": "2023-03-01T00:00:00",
+        "project_end_date": "2025-06-30T00:00:00",
+        "project_title": f"Project {project_id}",
+        "agency_code": "NIH",
+        "abstract_text": "Abstract",
+        "contact_pi_name": "Lovelace, Ada",
+        "award_amount": 1000,
+    }
+
+
+def _serve_total(total: int) -> Callable[..., mock.Mock]:
+    # Serve the page of results at each offset, every response reports the total
+    def post(url: str, json: dict, **kwargs: Any) -> mock.Mock:
+        offset, limit = json["offset"], json["limit"]
+        results = [_result(i) for i in range(offset, min(total, offset + limit))]
+        return mock.Mock(
+            **{"json.return_value": {"meta": {"total": total}, "results": results}}
+        )
+
+    return post
+
+
+###############################################################################
+
+
+def test_nih_total_from_first_chunk() -> None:
+    # Three pages of results
+    total = 2 * nih._DEFAULT_CHUNK_SIZE + 10
+    with mock.patch.object(
+        nih._SESSION,
+        "post",
+        side_effect=_serve_total(total),
+    ) as mock_post:
+        df = NIH.get_data(tqdm_kwargs={"disable": True})
+
+    # The first page also sizes the search, so there is one request per page
+    assert mock_post.call_count == 3
+    assert df.id.tolist() == [f"R01-{i}" for i in range(total)]
+
+
+def test_nih_no_grants() -> None:
+    # Nothing matches the search
+    with mock.patch.object(
+        nih._SESSION,
+        "post",
+        side_effect=_serve_total(0),
+    ) as mock_post:
+        df = NIH.get_data(tqdm_kwargs={"disable": True})
+
+    # Only the first page is requested
+    assert mock_post.call_count == 1
+    assert len(df) == 0
+    assert df.columns.tolist() == ALL_DATASET_FIELDS
+
+
+# More matches than the API will page through
+@mock.patch.object(nih._SESSION, "post", side_effect=_serve_total(10000))
+def test_nih_too_many_grants_offline(mock_post: mock.Mock) -> None:
+    with pytest.raises(ValueError, match="too many"):
+        NIH.get_data(tqdm_kwargs={"disable": True})
+
+    # Fails on the first page without requesting any others
+    assert mock_post.call_count == 1
+
+
 def test_nih_basics() -> None:
     # Get data
     df = NIH.get_data(
@@ -1,5 +1,15 @@
 #!/usr/bin/env python
 
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+from unittest import mock
+
+import requests
+
+from award_pynder.sources import nsf
+from award_pynder.sources.base import ALL_DATASET_FIELDS
 from award_pynder.sources.nsf import NSF, NSF_PROGRAM_TO_CFDA_NUMBER_LUT, NSFPrograms
 
 from ..utils import assert_dataset_basics
@@ -7,6 +17,109 @@ from ..utils import assert_dataset_basics
 ###############################################################################
 
 
+def _page(first_id: int, n_awards: int = nsf._DEFAULT_CHUNK_SIZE) -> list[dict]:
+    # Awards with every requested field filled in
+    return [
+        {
+            "id": str(award_id),
+            "date": "01/02/2014",
+            "startDate": "02/01/2014",
+            "expDate": "01/31/2017",
+            "title": f"Award {award_id}",
+            "awardeeName": "University",
+            "piFirstName": "Ada",
+            "piLastName": "Lovelace",
+            "cfdaNumber": "47.074",
+            "estimatedTotalAmt": "1000",
+            "abstractText": "Abstract",
+        }
+        for award_id in range(first_id, first_id + n_awards)
+    ]
+
+
+def _serve_pages(pages: Sequence[list[dict] | None]) -> Callable[..., mock.Mock]:
+    # Serve each page by its offset, None pages fail and pages past the
+    # last one are empty
+    def get(url: str, params: dict, **kwargs: Any) -> mock.Mock:
+        page = (params["offset"] - 1) // nsf._DEFAULT_CHUNK_SIZE
+        awards = pages[page] if page < len(pages) else []
+        if awards is None:
+            raise requests.ConnectionError(f"Page {page} failed")
+
+        return mock.Mock(**{"json.return_value": {"response": {"award": awards}}})
+
+    return get
+
+
+###############################################################################
+
+
+def test_nsf_stops_at_short_page() -> None:
+    # Second page is the last and only partly full
+    pages = [_page(0), _page(25, n_awards=5)]
+    with mock.patch.object(
+        nsf._SESSION,
+        "get",
+        side_effect=_serve_pages(pages),
+    ) as mock_get:
+        df = NSF.get_data(tqdm_kwargs={"disable": True})
+
+    # All awards are returned and no batch is requested after the short page
+    assert df.id.tolist() == [str(i) for i in range(30)]
+    assert mock_get.call_count == nsf._DEFAULT_MAX_WORKERS
+
+
+def test_nsf_stops_at_empty_page() -> None:
+    # The first batch is entirely full pages, so the end is only found at the
+    # empty first page of the next batch
+    pages = [_page(i * 25) for i in range(nsf._DEFAULT_MAX_WORKERS)]
+    with mock.patch.object(
+        nsf._SESSION,
+        "get",
+        side_effect=_serve_pages(pages),
+    ) as mock_get:
+        df = NSF.get_data(tqdm_kwargs={"disable": True})
+
+    # All awards are returned and the second batch is the last
+    assert df.id.tolist() == [str(i) for i in range(len(pages) * 25)]
+    assert mock_get.call_count == 2 * nsf._DEFAULT_MAX_WORKERS
+
+
+def test_nsf_drops_repeated_awards() -> None:
+    # Pages overlap with the previous page and repeat awards within a page
+    pages = [_page(0), _page(20), _page(50, n_awards=2) + _page(50, n_awards=1)]
+    with mock.patch.object(nsf._SESSION, "get", side_effect=_serve_pages(pages)):
+        df = NSF.get_data(tqdm_kwargs={"disable": True})
+
+    # Each award is kept once, in the order it was first returned
+    assert df.id.tolist() == [str(i) for i in [*range(45), 50, 51]]
+
+
+def test_nsf_failed_page_does_not_end_results() -> None:
+    # Second page fails, the pages after it still have awards
+    pages = [_page(0), None, _page(50), _page(75, n_awards=5)]
+    with mock.patch.object(nsf._SESSION, "get", side_effect=_serve_pages(pages)):
+        df = NSF.get_data(raise_on_error=False, tqdm_kwargs={"disable": True})
+
+    # Only the failed page is missing
+    assert df.id.tolist() == [str(i) for i in [*range(25), *range(50, 80)]]
+
+
+def test_nsf_stops_after_consecutive_failures() -> None:
+    # Every page fails
+    with mock.patch.object(
+        nsf._SESSION,
+        "get",
+        side_effect=requests.ConnectionError("NSF is down"),
+    ) as mock_get:
+        df = NSF.get_data(raise_on_error=False, tqdm_kwargs={"disable": True})
+
+    # Gives up rather than requesting pages forever
+    assert mock_get.call_count == nsf._MAX_CONSECUTIVE_FAILURES
+    assert len(df) == 0
+    assert df.columns.tolist() == ALL_DATASET_FIELDS
+
+
 def test_nsf() -> None:
     # Get data
     df = NSF.get_data(
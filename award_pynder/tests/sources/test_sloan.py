@@ -1,11 +1,86 @@
 #!/usr/bin/env python
 
+from unittest import mock
+
+from award_pynder.sources import sloan
+from award_pynder.sources.base import DatasetFields
 from award_pynder.sources.sloan import Sloan
 
 from ..utils import assert_dataset_basics
 
 ###############################################################################
 
+# Trimmed copy of a grants database results page with two grants
+_SLOAN_RESULTS_PAGE = b"""
+<html>
+<body>
+<table><tr><td class="results-count">2 Grants</td></tr></table>
+<ul class="data-list">
+  <li>
+    <header>
+      <div class="grantee"><span>grantee: </span>University of Washington</div>
+      <div class="amount"><span>amount: </span>$1,250,000</div>
+      <div class="year"><span>year: </span>2021</div>
+    </header>
+    <div class="details" data-accordian-group="grant-9876">
+      <div class="brief-description"><p>To support research software</p></div>
+      <div class="grid">
+        <ul class="col"><li><strong>Program</strong> Technology</li></ul>
+        <ul class="col">
+          <li><strong>Sub-program</strong> Better Software for Science</li>
+          <li><strong>Investigator</strong> Ada Lovelace</li>
+        </ul>
+      </div>
+    </div>
+  </li>
+  <li>
+    <header>
+      <div class="grantee"><span>grantee: </span>Example College</div>
+      <div class="amount"><span>amount: </span>$49,990</div>
+      <div class="year"><span>year: </span>2020</div>
+    </header>
+    <div class="details" data-accordian-group="grant-1234">
+      <div class="brief-description"><p>To hold a workshop</p></div>
+      <div class="grid">
+        <ul class="col"><li><strong>Program</strong> Research</li></ul>
+        <ul class="col">
+          <li><strong>Sub-program</strong> Scholarly Communication</li>
+          <li><strong>Investigator</strong> Grace Hopper</li>
+        </ul>
+      </div>
+    </div>
+  </li>
+</ul>
+</body>
+</html>
+"""
+
+###############################################################################
+
+
+def test_sloan_get_chunk_parsing() -> None:
+    # Serve the static page instead of making a request
+    with mock.patch.object(
+        sloan._SESSION,
+        "get",
+        return_value=mock.Mock(content=_SLOAN_RESULTS_PAGE),
+    ) as mock_get:
+        chunk = Sloan._get_chunk(query="software")
+
+    # Only a single request is made for the page
+    mock_get.assert_called_once()
+
+    # Check all fields were parsed and cleaned
+    assert chunk == {
+        DatasetFields.institution: ["University of Washington", "Example College"],
+        DatasetFields.amount: [1250000.0, 49990.0],
+        DatasetFields.year: [2021, 2020],
+        DatasetFields.title: ["To support research software", "To hold a workshop"],
+        DatasetFields.id_: [9876, 1234],
+        DatasetFields.program: ["Technology", "Research"],
+        DatasetFields.pi: ["Ada Lovelace", "Grace Hopper"],
+    }
+
 
 def test_sloan() -> None:
     # Get data
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Literal
+
+import pandas as pd
+import pytest
+
+from award_pynder.sources.base import DataSource, RateLimiter
+
+###############################################################################
+
+
+@pytest.mark.parametrize(
+    "fmt, date_format, dates, expected",
+    [
+        # Repeated and missing values map back to every original row
+        (
+            "date",
+            "ISO8601",
+            ["2020-01-01T00:00:00", None, "2020-01-01T00:00:00", "2021-06-30"],
+            ["2020-01-01", None, "2020-01-01", "2021-06-30"],
+        ),
+        (
+            "year",
+            "ISO8601",
+            ["2020-01-01T00:00:00", None, "2020-01-01T00:00:00", "2021-06-30"],
+            [2020, None, 2020, 2021],
+        ),
+        # Timestamps with an offset keep their local calendar date
+        (
+            "date",
+            "ISO8601",
+            ["2022-12-31T22:00:00-05:00", "2023-01-01T01:00:00+02:00"],
+            ["2022-12-31", "2023-01-01"],
+        ),
+        (
+            "year",
+            "ISO8601",
+            ["2022-12-31T22:00:00-05:00", "2023-01-01T01:00:00+02:00"],
+            [2022, 2023],
+        ),
+        # Values without a full date are still parsed as ISO8601
+        (
+            "date",
+            "ISO8601",
+            ["2020", "2021-06", "2022-12-31"],
+            ["2020-01-01", "2021-06-01", "2022-12-31"],
+        ),
+        (
+            "year",
+            "ISO8601",
+            ["2020", "2021-06", "2022-12-31"],
+            [2020, 2021, 2022],
+        ),
+        # Columns which aren't strings
+        (
+            "year",
+            "ISO8601",
+            [float("nan"), float("nan")],
+            [None, None],
+        ),
+        (
+            "date",
+            "ISO8601",
+            [datetime(2021, 3, 4, 10), None, datetime(2021, 3, 4, 10)],
+            ["2021-03-04", None, "2021-03-04"],
+        ),
+        # Explicit formats and unparseable values
+        (
+            "date",
+            "%m/%d/%Y",
+            ["12/31/2022", "not a date", "12/31/2022"],
+            ["2022-12-31", None, "2022-12-31"],
+        ),
+        (
+            "year",
+            "%m/%d/%Y",
+            ["12/31/2022", "not a date", "12/31/2022"],
+            [2022, None, 2022],
+        ),
+    ],
+)
+def test_format_dates_for_pynder_standard(
+    fmt: Literal["year", "date"],
+    date_format: str,
+    dates: list[Any],
+    expected: list[str | int | None],
+) -> None:
+    # Use a non-default index to check rows are mapped back in place
+    raw = pd.Series(dates, index=range(10, 10 + len(dates)), name="date")
+    formatted = DataSource._format_dates_for_pynder_standard(
+        raw,
+        fmt=fmt,
+        date_format=date_format,
+    )
+
+    # Check shape is preserved
+    assert formatted.index.equals(raw.index)
+    assert formatted.name == raw.name
+
+    # Check values, treating all missing markers the same
+    assert [None if pd.isna(value) else value for value in formatted] == expected
+
+    # Years are stored as nullable integers
+    if fmt == "year":
+        assert formatted.dtype == "Int64"
+
+
+def test_rate_limiter_spacing() -> None:
+    # Record when each call is let through, from several threads at once
+    rate_limiter = RateLimiter(min_interval=0.05)
+
+    def timed_wait() -> float:
+        rate_limiter.wait()
+        return time.monotonic()
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        calls = sorted(executor.map(lambda _: timed_wait(), range(6)))
+
+    # However the threads are scheduled, the nth call can't be let through
+    # before n intervals have passed
+    for i, call in enumerate(calls):
+        assert call - start >= i * 0.05
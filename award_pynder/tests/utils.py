@@ -18,10 +18,10 @@ def assert_dataset_basics(df: pd.DataFrame) -> None:
     assert set(df.columns) == set(ALL_DATASET_FIELDS)
 
     # Check no duplicates (overall)
-    assert df.duplicated().sum() == 0
+    assert not df.duplicated().any()
 
     # Check no duplicate ids
-    assert df.id.nunique() == len(df)
+    assert df.id.is_unique
 
     # Assert that there is at least some data
     assert len(df) > 0